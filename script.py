@@ -1,16 +1,45 @@
 import os
 import json
 import time
+import sqlite3
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+import random
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator, Awaitable, Callable, FrozenSet, Sequence, TypeVar
 
-import requests
-from web3 import Web3
-from web3.contract import Contract
-from web3.logs import DISCARD
-from web3.exceptions import BlockNotFound
+from aiohttp import ClientError, ClientResponseError, ClientSession, ClientTimeout, TCPConnector
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3, WebSocketProvider
+from web3.contract import AsyncContract
+from web3.contract.async_contract import AsyncContractFunction
+from web3.exceptions import BlockNotFound, MismatchedABI, ProviderConnectionError
+from web3.providers.rpc.utils import ExceptionRetryConfiguration
+from eth_typing import HexStr
+from hexbytes import HexBytes
+from web3.types import BlockData, EventData, FilterParams, LogReceipt, LogsSubscriptionArg, RPCResponse
 from dotenv import load_dotenv
 
+__all__ = [
+    'BlockchainConnector',
+    'BridgeOracle',
+    'BridgeOrchestrator',
+    'EventScout',
+    'FastJsonHTTPProvider',
+    'RpcEndpoint',
+    'StateStore',
+    'TransactionProcessor',
+    'WebsocketConnector',
+]
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError: # orjson is optional; the standard library parser produces identical results
+    orjson = None
+    _json_loads = json.loads
+
+T = TypeVar('T')
+
 # --- Basic Configuration ---
 load_dotenv()
 
@@ -23,14 +52,46 @@ logging.basicConfig(
 
 # --- Constants ---
 # In a real application, these would be part of a more extensive configuration system.
-SOURCE_CHAIN_RPC_URL = os.getenv('SOURCE_CHAIN_RPC_URL', 'https://rpc.ankr.com/eth_goerli')
+SOURCE_CHAIN_RPC_URLS = [url.strip() for url in os.getenv('SOURCE_CHAIN_RPC_URL', 'https://rpc.ankr.com/eth_goerli').split(',') if url.strip()]
+SOURCE_CHAIN_WS_URL = os.getenv('SOURCE_CHAIN_WS_URL') # Optional; enables push-based log subscriptions
+STATE_DB_PATH = os.getenv('STATE_DB_PATH', 'bridge_state.db')
 BRIDGE_CONTRACT_ADDRESS = os.getenv('BRIDGE_CONTRACT_ADDRESS', '0x26911325776632497673523528A55516394235a9') # Example address
 DESTINATION_CHAIN_ID = 80001 # Mumbai Testnet as an example
-ORACLE_API_ENDPOINT = 'https://api.coingecko.com/api/v3/simple/price?ids=ethereum&vs_currencies=usd'
+# Optional comma-separated token addresses; only their 'TokensLocked' events are requested from the node.
+TOKEN_ALLOWLIST = [address.strip() for address in os.getenv('TOKEN_ALLOWLIST', '').split(',') if address.strip()]
+VERBOSE_EVENT_LOGS = os.getenv('VERBOSE_EVENT_LOGS', '').lower() in ('1', 'true', 'yes') # Log every event's details at INFO level
+CHAINLINK_ETH_USD_FEED = os.getenv('CHAINLINK_ETH_USD_FEED', '0xD4a33860578De61DBAbDc8BFdb98FD742fA7028e') # Goerli ETH/USD
+CHAINLINK_PRICE_DECIMALS = 8 # Chainlink USD feeds report prices with 8 decimals
+PRICE_FEED_MAX_AGE = 3600 # Seconds after which a feed answer is considered stale (the ETH/USD heartbeat)
+ONE_ETH_WEI = 10**18
+ORACLE_CHECK_THRESHOLD_WEI = ONE_ETH_WEI # Transfers above this amount are valued with the price oracle
+SECURITY_THRESHOLD_USD = 10_000 # Transfers worth more are flagged for manual review
+# The security threshold in the units of `amount_wei * price_answer`, so that the check needs no float or Decimal
+SECURITY_THRESHOLD_SCALED = SECURITY_THRESHOLD_USD * ONE_ETH_WEI * 10**CHAINLINK_PRICE_DECIMALS
+STATE_DB_MMAP_SIZE = 64 * 1024 * 1024 # Bytes of the state database memory-mapped by SQLite
+MAX_PROCESSED_TRANSACTIONS = 100_000 # Transaction hashes remembered for deduplication
+MAX_CONCURRENT_ORACLE_CALLS = 8 # Keeps concurrent price feed reads within the RPC provider's rate limits
+RPC_TIMEOUT = 20 # Seconds per JSON-RPC HTTP request
+RPC_POOL_SIZE = 32 # Keep-alive connections held open to the RPC nodes
+RPC_ENDPOINT_COOLDOWN = 30.0 # Seconds a failed RPC endpoint is skipped while others are available
+RPC_LATENCY_SMOOTHING = 0.2 # Weight of the newest sample in an endpoint's latency moving average
+ORACLE_CACHE_TTL = 30.0 # Seconds an oracle price is reused before being fetched again
+WS_RETRY_DELAY = 30.0 # Seconds before re-attempting a dropped WebSocket subscription
+WS_MAX_RETRY_DELAY = 600.0
+MAX_BATCH_FAILURES = 3 # Consecutive rejected batch requests before falling back to individual requests
+INITIAL_CHUNK_BLOCKS = 100 # Size of the first block range scanned
+MIN_CHUNK_BLOCKS = 10
+MAX_CHUNK_BLOCKS = 10000 # Most providers cap eth_getLogs ranges around this size
+CHUNK_CEILING_RESET = 600.0 # Seconds after a rejected range before the chunk may grow past it again
+QUERY_RETRY_DELAY = 1.0 # Initial backoff, in seconds, once failed log queries reach MIN_CHUNK_BLOCKS
+MAX_QUERY_RETRY_DELAY = 60.0
+BLOCK_TIME_ESTIMATE = 12.0 # Initial guess, in seconds, refined from observed block timestamps
+BLOCK_TIME_SMOOTHING = 0.1 # Weight of the newest interval in the block time moving average
+MIN_POLL_INTERVAL = 1.0 # Shortest wait, in seconds, between polls while caught up
 
 # A simplified ABI for the bridge contract's 'TokensLocked' event.
 # This defines the structure of the event we are listening for.
-BRIDGE_CONTRACT_ABI = json.loads('''
+BRIDGE_CONTRACT_ABI = _json_loads('''
 [
     {
         "anonymous": false,
@@ -72,104 +133,528 @@ BRIDGE_CONTRACT_ABI = json.loads('''
 ]
 ''')
 
+# Minimal ABI of Chainlink's AggregatorV3Interface
+AGGREGATOR_V3_ABI = _json_loads('''
+[
+    {
+        "inputs": [],
+        "name": "latestRoundData",
+        "outputs": [
+            {"internalType": "uint80", "name": "roundId", "type": "uint80"},
+            {"internalType": "int256", "name": "answer", "type": "int256"},
+            {"internalType": "uint256", "name": "startedAt", "type": "uint256"},
+            {"internalType": "uint256", "name": "updatedAt", "type": "uint256"},
+            {"internalType": "uint80", "name": "answeredInRound", "type": "uint80"}
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+''')
+
 # --- Architectural Components ---
 
+class FastJsonHTTPProvider(AsyncHTTPProvider):
+    """An AsyncHTTPProvider that decodes JSON-RPC responses with orjson when it is installed."""
+
+    @staticmethod
+    def decode_rpc_response(raw_response: bytes) -> RPCResponse:
+        if orjson is None:
+            return AsyncHTTPProvider.decode_rpc_response(raw_response)
+        # JSON-RPC encodes quantities as hex strings, so orjson reading integers
+        # beyond 64 bits as floats does not affect results.
+        try:
+            return orjson.loads(raw_response)
+        except orjson.JSONDecodeError:
+            # e.g. NaN or Infinity literals, which the standard library accepts
+            return AsyncHTTPProvider.decode_rpc_response(raw_response)
+
+class RpcEndpoint:
+    """An RPC endpoint in a connector's pool, together with its latency and health statistics."""
+
+    def __init__(self, url: str):
+        """
+        Args:
+            url (str): The HTTP RPC endpoint.
+        """
+        self.url = url
+        self.web3: Optional[AsyncWeb3] = None
+        self.latency: Optional[float] = None # Moving average of successful request durations, in seconds
+        self.unhealthy_until = 0.0
+
+    def is_healthy(self, now: float) -> bool:
+        """Returns True unless the endpoint failed within the last `RPC_ENDPOINT_COOLDOWN` seconds."""
+        return now >= self.unhealthy_until
+
+    def record_success(self, elapsed: float) -> None:
+        """Folds the duration of a successful request into the endpoint's latency average."""
+        if self.latency is None:
+            self.latency = elapsed
+        else:
+            self.latency = (1 - RPC_LATENCY_SMOOTHING) * self.latency + RPC_LATENCY_SMOOTHING * elapsed
+
+    def record_failure(self) -> None:
+        """Takes the endpoint out of rotation for `RPC_ENDPOINT_COOLDOWN` seconds."""
+        self.unhealthy_until = time.monotonic() + RPC_ENDPOINT_COOLDOWN
+
 class BlockchainConnector:
-    """Manages the connection to a single blockchain via Web3.py."""
+    """
+    Manages the connection to a blockchain via Web3.py's async API.
+    Requests are routed to the fastest healthy endpoint of a pool of RPC nodes,
+    failing over to the next one when an endpoint errors or times out.
+    """
 
-    def __init__(self, rpc_url: str):
+    def __init__(self, rpc_urls: List[str], session: Optional[ClientSession] = None):
         """
-        Initializes the connector with a given RPC URL.
+        Initializes the connector with a pool of RPC URLs for the same chain.
+        The connection itself is established by awaiting `connect()`.
 
         Args:
-            rpc_url (str): The HTTP RPC endpoint for the blockchain node.
+            rpc_urls (List[str]): The HTTP RPC endpoints for the blockchain.
+            session (Optional[ClientSession]): A shared aiohttp session to send requests through.
+                If omitted, the connector creates (and owns) one with `create_session()`.
+        """
+        self.rpc_urls = rpc_urls
+        self.endpoints = [RpcEndpoint(url) for url in rpc_urls]
+        self.web3: Optional[AsyncWeb3] = None
+        self.batching_supported = True
+        self.session = session
+        self._owns_session = session is None
+
+    @staticmethod
+    def create_session() -> ClientSession:
+        """
+        Creates an aiohttp session that keeps connections to the node alive.
+        Web3.py's default session closes the connection after every request, paying a
+        new TCP/TLS handshake per call. Must be called from within a running event loop.
+
+        Returns:
+            ClientSession: The session, with a sized keep-alive connection pool.
+        """
+        return ClientSession(
+            raise_for_status=True,
+            connector=TCPConnector(limit=RPC_POOL_SIZE, enable_cleanup_closed=True),
+            timeout=ClientTimeout(total=RPC_TIMEOUT)
+        )
+
+    async def connect(self) -> None:
         """
-        self.rpc_url = rpc_url
-        self.web3: Optional[Web3] = None
-        self._connect()
+        Establishes the connections to the blockchain nodes. Endpoints that cannot be
+        reached are kept in the pool but marked unhealthy, so that they are retried later.
+        """
+        if self.session is None:
+            self.session = self.create_session()
+        await asyncio.gather(*[self._connect_endpoint(endpoint) for endpoint in self.endpoints])
+        healthy = self._ranked_endpoints()
+        if healthy and healthy[0].is_healthy(time.monotonic()):
+            self.web3 = healthy[0].web3
+        else:
+            logging.error("Could not connect to any blockchain node.")
+            self.web3 = None
 
-    def _connect(self) -> None:
-        """Establishes the connection to the blockchain node."""
+    async def _connect_endpoint(self, endpoint: RpcEndpoint) -> None:
+        """Sets up the Web3 instance of an endpoint on the shared session and checks that it responds."""
         try:
-            self.web3 = Web3(Web3.HTTPProvider(self.rpc_url))
-            if not self.web3.is_connected():
-                raise ConnectionError(f"Failed to connect to blockchain node at {self.rpc_url}")
-            logging.info(f"Successfully connected to blockchain node. Chain ID: {self.web3.eth.chain_id}")
+            provider = FastJsonHTTPProvider(
+                endpoint.url,
+                request_kwargs={'timeout': ClientTimeout(total=RPC_TIMEOUT)},
+                exception_retry_configuration=ExceptionRetryConfiguration(
+                    errors=(ClientError, asyncio.TimeoutError),
+                    # With other endpoints to fail over to, retrying a failing one only adds latency.
+                    retries=3 if len(self.endpoints) == 1 else 1,
+                    backoff_factor=0.3
+                )
+            )
+            await provider.cache_async_session(self.session)
+            endpoint.web3 = AsyncWeb3(provider)
+            if not await endpoint.web3.is_connected():
+                raise ConnectionError(f"Failed to connect to blockchain node at {endpoint.url}")
+            logging.info(f"Successfully connected to blockchain node at {endpoint.url}. Chain ID: {await endpoint.web3.eth.chain_id}")
         except Exception as e:
             logging.error(f"Error connecting to blockchain node: {e}")
-            self.web3 = None
+            endpoint.record_failure()
 
-    def get_contract(self, address: str, abi: List[Dict[str, Any]]) -> Optional[Contract]:
+    async def disconnect(self) -> None:
+        """Closes the HTTP session, if this connector created it."""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+        for endpoint in self.endpoints:
+            endpoint.web3 = None
+        self.web3 = None
+
+    def _ranked_endpoints(self) -> List[RpcEndpoint]:
+        """
+        Orders the pool for the next request: healthy endpoints first, fastest first.
+        Endpoints without latency samples yet are tried before measured ones; ties are broken randomly.
         """
-        Returns a Web3.py contract instance.
+        now = time.monotonic()
+        endpoints = [endpoint for endpoint in self.endpoints if endpoint.web3 is not None]
+        random.shuffle(endpoints)
+        endpoints.sort(key=lambda endpoint: (not endpoint.is_healthy(now), endpoint.latency or 0.0))
+        return endpoints
+
+    @staticmethod
+    def is_transport_error(error: Exception) -> bool:
+        """
+        Tells failures of the endpoint (it could not be reached, timed out, or is overloaded or rate-limiting)
+        apart from errors about the request itself, e.g. JSON-RPC error responses.
+
+        Args:
+            error (Exception): The error raised by a request.
+
+        Returns:
+            bool: True if another endpoint might serve the same request.
+        """
+        if isinstance(error, ClientResponseError):
+            return error.status == 429 or error.status >= 500
+        return isinstance(error, (ClientError, asyncio.TimeoutError, ConnectionError, ProviderConnectionError))
+
+    async def request(self, method: Callable[[AsyncWeb3], Awaitable[T]]) -> T:
+        """
+        Runs a request against the pool. The request is sent to the preferred endpoint;
+        if the endpoint cannot be reached (connection errors, timeouts, HTTP 429/5xx), it is
+        marked unhealthy for `RPC_ENDPOINT_COOLDOWN` seconds and the request is retried on the next one.
+        Errors returned by the node itself, such as JSON-RPC error responses, are raised to the
+        caller right away: the request would fail the same way on every endpoint.
+
+        Args:
+            method (Callable[[AsyncWeb3], Awaitable[T]]): Issues the request through the given Web3 instance.
+
+        Returns:
+            T: The result of the first successful attempt.
+
+        Raises:
+            Exception: A non-transport error, or the error of the last attempt if no endpoint could be reached.
+        """
+        error: Exception = ConnectionError("Not connected to any blockchain node.")
+        for endpoint in self._ranked_endpoints():
+            started = time.monotonic()
+            try:
+                result = await method(endpoint.web3)
+            except Exception as e:
+                if not self.is_transport_error(e):
+                    raise
+                endpoint.record_failure()
+                logging.warning(f"Request to {endpoint.url} failed: {e}")
+                error = e
+                continue
+            endpoint.record_success(time.monotonic() - started)
+            self.web3 = endpoint.web3
+            return result
+        raise error
+
+    async def get_contract(self, address: str, abi: List[Dict[str, Any]]) -> Optional[AsyncContract]:
+        """
+        Returns a Web3.py async contract instance.
 
         Args:
             address (str): The contract address.
             abi (List[Dict[str, Any]]): The contract's ABI.
 
         Returns:
-            Optional[Contract]: A contract object or None if not connected.
+            Optional[AsyncContract]: A contract object or None if not connected.
         """
-        if not self.web3 or not self.web3.is_connected():
+        if not self.web3:
             logging.warning("Cannot get contract, not connected to blockchain.")
             return None
         
         checksum_address = self.web3.to_checksum_address(address)
         return self.web3.eth.contract(address=checksum_address, abi=abi)
 
-    def get_latest_block_number(self) -> Optional[int]:
+    async def get_latest_block_number(self) -> Optional[int]:
         """
         Fetches the latest block number from the connected chain.
 
         Returns:
             Optional[int]: The latest block number or None on failure.
         """
-        if not self.web3 or not self.web3.is_connected():
-            logging.warning("Cannot get block number, not connected.")
-            return None
         try:
-            return self.web3.eth.block_number
+            return await self.request(lambda web3: web3.eth.block_number)
         except Exception as e:
             logging.error(f"Failed to fetch latest block number: {e}")
             return None
 
+    async def get_latest_block(self) -> Optional[BlockData]:
+        """
+        Fetches the header of the latest block, which carries its number and timestamp.
+
+        Returns:
+            Optional[BlockData]: The latest block (without transactions) or None on failure.
+        """
+        try:
+            return await self.request(lambda web3: web3.eth.get_block('latest'))
+        except Exception as e:
+            logging.error(f"Failed to fetch latest block: {e}")
+            return None
+
+    async def get_logs(self, filter_params: FilterParams) -> List[LogReceipt]:
+        """
+        Fetches the raw logs matching a filter.
+
+        Args:
+            filter_params (FilterParams): The `eth_getLogs` filter parameters.
+
+        Returns:
+            List[LogReceipt]: The matching logs.
+
+        Raises:
+            Exception: If the query failed on every endpoint.
+        """
+        return await self.request(lambda web3: web3.eth.get_logs(filter_params))
+
+    async def batch_poll(
+        self,
+        filter_params: FilterParams,
+        extra_calls: Sequence[Callable[[AsyncWeb3], AsyncContractFunction]] = ()
+    ) -> Optional[Tuple[BlockData, List[LogReceipt], List[Any]]]:
+        """
+        Fetches the latest block and the logs matching a filter
+        in a single JSON-RPC batch request.
+
+        Args:
+            filter_params (FilterParams): The `eth_getLogs` filter parameters.
+            extra_calls (Sequence[Callable[[AsyncWeb3], AsyncContractFunction]]): Builders of contract calls
+                to piggyback on the same batch, bound to the Web3 instance of the endpoint that serves it.
+
+        Returns:
+            Optional[Tuple[BlockData, List[LogReceipt], List[Any]]]: The latest block, the raw logs and
+            the decoded results of `extra_calls`, or None if the batch failed or batching has been disabled.
+        """
+        if not self.web3 or not self.batching_supported:
+            return None
+
+        async def send_batch(web3: AsyncWeb3) -> List[Any]:
+            async with web3.batch_requests() as batch:
+                batch.add(web3.eth.get_block('latest'))
+                batch.add(web3.eth.get_logs(filter_params))
+                for build_call in extra_calls:
+                    batch.add(build_call(web3))
+                return await batch.async_execute()
+
+        try:
+            block, logs, *extra_results = await self.request(send_batch)
+            return block, logs, extra_results
+        except Exception as e:
+            logging.warning(f"Batch request failed: {e}")
+            return None
+
+class WebsocketConnector(BlockchainConnector):
+    """
+    Manages a persistent WebSocket connection to a blockchain node.
+    In addition to the regular connector methods, it supports `eth_subscribe` log subscriptions.
+    The connection is registered as the connector's only pool endpoint, so the regular methods use it too.
+    """
+
+    def __init__(self, ws_url: str):
+        """
+        Args:
+            ws_url (str): The WebSocket RPC endpoint for the blockchain node.
+        """
+        super().__init__([ws_url])
+        self.ws_url = ws_url
+
+    async def connect(self) -> None:
+        """Establishes the WebSocket connection to the blockchain node."""
+        endpoint = self.endpoints[0]
+        try:
+            self.web3 = await AsyncWeb3(WebSocketProvider(self.ws_url))
+            if not await self.web3.is_connected():
+                raise ConnectionError(f"Failed to connect to blockchain node at {self.ws_url}")
+            logging.info(f"Successfully opened WebSocket connection. Chain ID: {await self.web3.eth.chain_id}")
+        except Exception as e:
+            logging.error(f"Error opening WebSocket connection: {e}")
+            self.web3 = None
+        endpoint.web3 = self.web3
+        endpoint.unhealthy_until = 0.0
+
+    async def disconnect(self) -> None:
+        """Closes the WebSocket connection, if open."""
+        if self.web3:
+            await self.web3.provider.disconnect()
+            self.web3 = None
+        self.endpoints[0].web3 = None
+
+    async def subscribe_logs(self, log_filter: LogsSubscriptionArg) -> HexStr:
+        """
+        Subscribes to logs matching a filter. Matching logs are queued by the
+        provider until they are consumed through `stream_logs()`.
+
+        Args:
+            log_filter (LogsSubscriptionArg): The address and topics to subscribe to.
+
+        Returns:
+            HexStr: The subscription ID assigned by the node.
+        """
+        subscription_id = await self.web3.eth.subscribe('logs', log_filter)
+        logging.info(f"Subscribed to logs with subscription ID: {subscription_id}")
+        return subscription_id
+
+    async def stream_logs(self) -> AsyncIterator[LogReceipt]:
+        """
+        Yields raw logs as the node pushes them for the active subscription.
+
+        Yields:
+            LogReceipt: Each log delivered by the subscription.
+        """
+        async for message in self.web3.socket.process_subscriptions():
+            yield message['result']
+
 class BridgeOracle:
     """
-    Simulates an oracle that provides external data, such as token prices or security validations.
-    Uses the 'requests' library to fetch data from an external API.
+    Provides external data for validation, such as token prices.
+    Prices are read from a Chainlink price feed with `eth_call`, over the connector's
+    existing RPC session, instead of from a separate HTTP API.
     """
 
-    def __init__(self, api_endpoint: str):
+    def __init__(self, connector: BlockchainConnector, feed_address: str, cache_ttl: float = ORACLE_CACHE_TTL):
         """
-        Initializes the oracle with an API endpoint.
+        Initializes the oracle with a price feed contract.
 
         Args:
-            api_endpoint (str): The URL of the external data source.
+            connector (BlockchainConnector): The connector whose node is queried for the feed.
+            feed_address (str): The address of the Chainlink ETH/USD price feed.
+            cache_ttl (float): How long, in seconds, a fetched price is served from the cache.
         """
-        self.api_endpoint = api_endpoint
+        self.connector = connector
+        self.feed_address = Web3.to_checksum_address(feed_address)
+        self._price_cache: Dict[str, Tuple[int, float]] = {}
+        self._cache_ttl = cache_ttl
+        self._refresh: Optional[asyncio.Task] = None
+
+    def price_call(self) -> Optional[Callable[[AsyncWeb3], AsyncContractFunction]]:
+        """
+        Returns a builder of the feed's `latestRoundData()` call if the cached price has expired,
+        so that it can be piggybacked on another batch request. Its result is passed to `update_price`.
+
+        Returns:
+            Optional[Callable[[AsyncWeb3], AsyncContractFunction]]: Builds the contract call for a given
+            Web3 instance, or None if the cached price is still fresh.
+        """
+        if self._cached_price() is not None:
+            return None
+        return self._latest_round_data
+
+    async def get_eth_price_in_usd(self) -> Optional[float]:
+        """
+        Fetches the current price of Ethereum in USD from the Chainlink price feed.
 
-    def get_eth_price_in_usd(self) -> Optional[float]:
+        Returns:
+            Optional[float]: The price of ETH in USD, or None if the call fails.
+        """
+        answer = await self.get_eth_price_answer()
+        return answer / 10**CHAINLINK_PRICE_DECIMALS if answer is not None else None
+
+    async def get_eth_price_answer(self) -> Optional[int]:
         """
-        Fetches the current price of Ethereum in USD from CoinGecko API.
+        Fetches the current price of Ethereum in USD as the feed's integer answer,
+        i.e. scaled by 10**`CHAINLINK_PRICE_DECIMALS`, for exact integer arithmetic.
+        Prices are cached for `cache_ttl` seconds so that bursts of events share a single call;
+        concurrent callers that miss the cache wait for the same feed call instead of sending their own.
 
         Returns:
-            Optional[float]: The price of ETH in USD, or None if the request fails.
+            Optional[int]: The scaled price of ETH in USD, or None if the call fails.
         """
+        answer = self._cached_price()
+        if answer is not None:
+            return answer
+
+        if self._refresh is None or self._refresh.done():
+            self._refresh = asyncio.ensure_future(self._fetch_answer())
+        # Shielded so that a cancelled caller does not cancel the call the others are waiting for.
+        return await asyncio.shield(self._refresh)
+
+    async def _fetch_answer(self) -> Optional[int]:
+        """Reads `latestRoundData()` from the feed and caches its answer (see `update_price`)."""
         try:
-            response = requests.get(self.api_endpoint, timeout=10)
-            response.raise_for_status()  # Raises an HTTPError for bad responses (4xx or 5xx)
-            data = response.json()
-            price = data.get('ethereum', {}).get('usd')
-            if price:
-                logging.info(f"Oracle fetched ETH price: ${price}")
-                return float(price)
-            else:
-                logging.warning("Oracle response did not contain expected price data.")
-                return None
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Oracle API request failed: {e}")
+            round_data = await self.connector.request(lambda web3: self._latest_round_data(web3).call())
+        except Exception as e:
+            logging.error(f"Price feed call failed: {e}")
+            return None
+        return self.update_price(round_data)
+
+    def update_price(self, round_data: Tuple[int, int, int, int, int]) -> Optional[int]:
+        """
+        Validates a `latestRoundData()` result and caches its price.
+
+        Args:
+            round_data (Tuple[int, int, int, int, int]): The decoded round: roundId, answer,
+                startedAt, updatedAt and answeredInRound.
+
+        Returns:
+            Optional[int]: The scaled price of ETH in USD, or None if the answer is invalid or stale.
+        """
+        _, answer, _, updated_at, _ = round_data
+        if answer <= 0:
+            logging.warning(f"Price feed returned an invalid answer: {answer}")
+            return None
+        if time.time() - updated_at > PRICE_FEED_MAX_AGE:
+            logging.warning(f"Price feed answer is stale (last updated at {updated_at}).")
             return None
 
+        logging.info(f"Oracle fetched ETH price: ${answer / 10**CHAINLINK_PRICE_DECIMALS}")
+        self._price_cache['eth'] = (answer, time.monotonic())
+        return answer
+
+    def _cached_price(self) -> Optional[int]:
+        """Returns the cached scaled price, or None if there is none or it has expired."""
+        entry = self._price_cache.get('eth')
+        if entry and time.monotonic() - entry[1] < self._cache_ttl:
+            return entry[0]
+        return None
+
+    def _latest_round_data(self, web3: AsyncWeb3) -> AsyncContractFunction:
+        """Builds the feed's `latestRoundData()` call on a Web3 instance of the connector's pool."""
+        return web3.eth.contract(address=self.feed_address, abi=AGGREGATOR_V3_ABI).functions.latestRoundData()
+
+class StateStore:
+    """
+    Persists the listener's progress in SQLite so that it can resume after a restart
+    without losing or re-scanning history.
+    Uses WAL journaling, so each checkpoint is a cheap append rather than a full database sync.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens (or creates) the state database.
+
+        Args:
+            path (str): Path of the SQLite database file.
+        """
+        self._db = sqlite3.connect(path, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute(f'PRAGMA mmap_size={STATE_DB_MMAP_SIZE}')
+        self._db.execute('CREATE TABLE IF NOT EXISTS state (id INTEGER PRIMARY KEY CHECK (id = 1), last_block INTEGER NOT NULL)')
+        self._db.execute('CREATE TABLE IF NOT EXISTS processed_transactions (tx_hash TEXT PRIMARY KEY)')
+
+    def load_last_block(self) -> Optional[int]:
+        """
+        Returns:
+            Optional[int]: The last fully processed block, or None if nothing was stored yet.
+        """
+        row = self._db.execute('SELECT last_block FROM state WHERE id = 1').fetchone()
+        return row[0] if row else None
+
+    def save_last_block(self, block_number: int) -> None:
+        """Stores the last fully processed block."""
+        self._db.execute(
+            'INSERT INTO state (id, last_block) VALUES (1, ?) ON CONFLICT(id) DO UPDATE SET last_block = excluded.last_block',
+            (block_number,)
+        )
+
+    def is_processed(self, tx_hash: str) -> bool:
+        """Checks whether a transaction has been processed, using the primary key index."""
+        return self._db.execute('SELECT 1 FROM processed_transactions WHERE tx_hash = ?', (tx_hash,)).fetchone() is not None
+
+    def mark_processed(self, tx_hash: str) -> None:
+        """Records a processed transaction."""
+        self._db.execute('INSERT OR IGNORE INTO processed_transactions (tx_hash) VALUES (?)', (tx_hash,))
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._db.close()
+
 class TransactionProcessor:
     """
     Processes validated events from the EventScout.
@@ -177,29 +662,114 @@ class TransactionProcessor:
     and simulating the execution on the destination chain.
     """
 
-    def __init__(self, oracle: BridgeOracle):
+    def __init__(
+        self,
+        oracle: BridgeOracle,
+        max_processed: int = MAX_PROCESSED_TRANSACTIONS,
+        max_concurrent_oracle_calls: int = MAX_CONCURRENT_ORACLE_CALLS,
+        store: Optional[StateStore] = None,
+        verbose: bool = False
+    ):
         """
         Initializes the processor with a data oracle.
 
         Args:
             oracle (BridgeOracle): An oracle for fetching external data for validation.
+            max_processed (int): How many processed transaction hashes to remember for deduplication.
+                The least recently seen hashes are evicted first, keeping memory bounded.
+            max_concurrent_oracle_calls (int): Upper bound on oracle lookups in flight during concurrent processing.
+            store (Optional[StateStore]): Persistent record of processed transactions. The in-memory
+                cache is checked first; the store covers transactions processed before a restart or evicted.
+            verbose (bool): Log the details of every event at INFO level. By default they are logged at
+                DEBUG level, and each batch logs a single INFO summary instead.
         """
         self.oracle = oracle
-        self.processed_transactions = set()
+        self.processed_transactions: OrderedDict[str, None] = OrderedDict()
+        self._max_processed = max_processed
+        self._in_flight = set()
+        self._oracle_semaphore = asyncio.Semaphore(max_concurrent_oracle_calls)
+        self.store = store
+        self._detail_level = logging.INFO if verbose else logging.DEBUG
 
-    def process_lock_event(self, event: Dict[str, Any]) -> None:
+    async def process_lock_event(self, event: Dict[str, Any]) -> bool:
         """
-        Handles a 'TokensLocked' event.
+        Handles a 'TokensLocked' event without blocking the event loop, so that
+        several events can be processed concurrently with `asyncio.gather`.
+        At most `max_concurrent_oracle_calls` oracle lookups are in flight at a time.
 
         Args:
             event (Dict[str, Any]): The parsed event data from a transaction log.
+
+        Returns:
+            bool: True if the transfer was executed, False if it was skipped or halted.
         """
-        tx_hash = event['transactionHash'].hex()
-        if tx_hash in self.processed_transactions:
-            logging.warning(f"Skipping already processed transaction: {tx_hash}")
-            return
+        transfer = self._extract_transfer(event)
+        if transfer is None:
+            return False
+        tx_hash, recipient, amount_wei, token = transfer
+
+        # Claim the transaction so that concurrent duplicates are skipped while this one is in flight.
+        self._in_flight.add(tx_hash)
+        try:
+            # --- 2. External Data Validation (using Oracle) ---
+            # Example: For high-value transfers, check against a price oracle.
+            if amount_wei > ORACLE_CHECK_THRESHOLD_WEI: # Let's say any transfer > 1 ETH requires an oracle check
+                async with self._oracle_semaphore:
+                    eth_price = await self.oracle.get_eth_price_answer()
+                if not self._verify_value(amount_wei, eth_price):
+                    return False
+
+            # --- 3. Simulate Execution on Destination Chain ---
+            self._simulate_destination_mint(recipient, amount_wei, token, tx_hash)
+            self._mark_processed(tx_hash)
+            return True
+        finally:
+            self._in_flight.discard(tx_hash)
 
-        logging.info(f"Processing new 'TokensLocked' event from transaction: {tx_hash}")
+    async def process_batch(self, columns: Dict[str, List[Any]]) -> None:
+        """
+        Handles a column-oriented batch of 'TokensLocked' events (see `EventScout.to_columns`).
+        Events for other destination chains or with invalid amounts are filtered out in bulk;
+        only the remaining ones go through the per-event path, concurrently.
+
+        Args:
+            columns (Dict[str, List[Any]]): The batch, as parallel lists of event fields.
+        """
+        destination_chains = columns['destination_chains']
+        amounts = columns['amounts']
+        selected = [
+            i for i, (destination_chain, amount_wei) in enumerate(zip(destination_chains, amounts))
+            if destination_chain == DESTINATION_CHAIN_ID and amount_wei > 0
+        ]
+        skipped = len(amounts) - len(selected)
+        if skipped:
+            logging.info(f"Skipped {skipped} event(s) for other destination chains or with invalid amounts.")
+
+        events = columns['events']
+        results = await asyncio.gather(*[self.process_lock_event(events[i]) for i in selected])
+        if events:
+            logging.info(f"Processed a batch of {len(events)} event(s): {sum(results)} executed, {len(events) - sum(results)} skipped or halted.")
+
+    def _extract_transfer(self, event: Dict[str, Any]) -> Optional[Tuple[str, str, int, str]]:
+        """
+        Deduplicates, extracts and validates the data of a 'TokensLocked' event.
+
+        Args:
+            event (Dict[str, Any]): The parsed event data from a transaction log.
+
+        Returns:
+            Optional[Tuple[str, str, int, str]]: The transaction hash, recipient, amount in wei and token,
+            or None if the event should be skipped.
+        """
+        tx_hash = Web3.to_hex(event['transactionHash'])
+        detailed = logging.root.isEnabledFor(self._detail_level)
+        if self._is_processed(tx_hash):
+            if detailed:
+                logging.log(self._detail_level, "Skipping already processed transaction: %s", tx_hash)
+            return None
+
+        if detailed:
+            logging.log(self._detail_level, "Processing new 'TokensLocked' event from transaction: %s", tx_hash)
 
         # --- 1. Data Extraction and Validation ---
         try:
@@ -209,39 +779,69 @@ class TransactionProcessor:
             destination_chain = event_args['destinationChainId']
             token = event_args['token']
 
-            logging.info(f"Event Details: Recipient={recipient}, Amount={amount_wei}, DestChain={destination_chain}, Token={token}")
+            if detailed:
+                logging.log(
+                    self._detail_level,
+                    "Event Details: Recipient=%s, Amount=%s, DestChain=%s, Token=%s",
+                    recipient, amount_wei, destination_chain, token
+                )
 
             # Basic business logic validation
             if destination_chain != DESTINATION_CHAIN_ID:
                 logging.warning(f"Skipping event for unsupported destination chain {destination_chain}")
-                return
+                return None
             
             if amount_wei <= 0:
                 logging.error(f"Invalid amount in event: {amount_wei}. Skipping.")
-                return
+                return None
 
         except KeyError as e:
             logging.error(f"Event data is missing expected key: {e}. Event: {event}")
-            return
-        
-        # --- 2. External Data Validation (using Oracle) ---
-        # Example: For high-value transfers, check against a price oracle.
-        amount_ether = Web3.from_wei(amount_wei, 'ether')
-        if amount_ether > 1: # Let's say any transfer > 1 ETH requires an oracle check
-            eth_price = self.oracle.get_eth_price_in_usd()
-            if eth_price is not None:
-                value_usd = float(amount_ether) * eth_price
-                logging.info(f"High-value transfer detected. Amount: {amount_ether:.4f} ETH, Value: ${value_usd:,.2f}")
-                if value_usd > 10000: # Additional security threshold
-                    logging.warning(f"Transfer value ${value_usd:,.2f} exceeds security threshold. Flagging for manual review.")
-                    # In a real system, this might trigger a different workflow.
-            else:
-                logging.error("Could not verify transfer value with oracle. Halting processing for safety.")
-                return
-
-        # --- 3. Simulate Execution on Destination Chain ---
-        self._simulate_destination_mint(recipient, amount_wei, token, tx_hash)
-        self.processed_transactions.add(tx_hash)
+            return None
+
+        return tx_hash, recipient, amount_wei, token
+
+    def _verify_value(self, amount_wei: int, eth_price: Optional[int]) -> bool:
+        """
+        Checks the USD value of a high-value transfer against the security threshold.
+        The comparison is done on integers; the value is only converted for log messages.
+
+        Args:
+            amount_wei (int): The transferred amount in wei.
+            eth_price (Optional[int]): The ETH/USD price from the oracle, scaled by
+                10**`CHAINLINK_PRICE_DECIMALS`, or None if the lookup failed.
+
+        Returns:
+            bool: False if the value could not be verified and processing must halt, True otherwise.
+        """
+        if eth_price is None:
+            logging.error("Could not verify transfer value with oracle. Halting processing for safety.")
+            return False
+
+        value_scaled = amount_wei * eth_price
+        if logging.root.isEnabledFor(self._detail_level):
+            value_usd = value_scaled / (ONE_ETH_WEI * 10**CHAINLINK_PRICE_DECIMALS)
+            logging.log(self._detail_level, "High-value transfer detected. Amount: %.4f ETH, Value: $%s", Web3.from_wei(amount_wei, 'ether'), f"{value_usd:,.2f}")
+        if value_scaled > SECURITY_THRESHOLD_SCALED: # Additional security threshold
+            value_usd = value_scaled / (ONE_ETH_WEI * 10**CHAINLINK_PRICE_DECIMALS)
+            logging.warning(f"Transfer value ${value_usd:,.2f} exceeds security threshold. Flagging for manual review.")
+            # In a real system, this might trigger a different workflow.
+        return True
+
+    def _is_processed(self, tx_hash: str) -> bool:
+        """Checks the in-memory cache, in-flight transactions and, on a miss, the persistent store."""
+        if tx_hash in self.processed_transactions:
+            self.processed_transactions.move_to_end(tx_hash)
+            return True
+        return tx_hash in self._in_flight or (self.store is not None and self.store.is_processed(tx_hash))
+
+    def _mark_processed(self, tx_hash: str) -> None:
+        """Records a processed transaction, evicting the least recently seen one when the cache is full."""
+        self.processed_transactions[tx_hash] = None
+        if len(self.processed_transactions) > self._max_processed:
+            self.processed_transactions.popitem(last=False)
+        if self.store is not None:
+            self.store.mark_processed(tx_hash)
 
     def _simulate_destination_mint(self, recipient: str, amount: int, token: str, source_tx_hash: str) -> None:
         """
@@ -249,57 +849,251 @@ class TransactionProcessor:
         In a real bridge, this would involve creating and signing a transaction
         on the destination chain using a wallet controlled by the validator network.
         """
-        logging.info("--- SIMULATING DESTINATION CHAIN ACTION ---")
-        logging.info(f"Recipient: {recipient}")
-        logging.info(f"Amount (wei): {amount}")
-        logging.info(f"Token (source address): {token}")
-        logging.info(f"Source Tx Hash: {source_tx_hash}")
-        logging.info("Action: A transaction would be created to mint wrapped tokens on chain ID {DESTINATION_CHAIN_ID}.")
-        logging.info("--- SIMULATION COMPLETE ---")
+        if not logging.root.isEnabledFor(self._detail_level):
+            return
+        level = self._detail_level
+        logging.log(level, "--- SIMULATING DESTINATION CHAIN ACTION ---")
+        logging.log(level, "Recipient: %s", recipient)
+        logging.log(level, "Amount (wei): %s", amount)
+        logging.log(level, "Token (source address): %s", token)
+        logging.log(level, "Source Tx Hash: %s", source_tx_hash)
+        logging.log(level, "Action: A transaction would be created to mint wrapped tokens on chain ID %s.", DESTINATION_CHAIN_ID)
+        logging.log(level, "--- SIMULATION COMPLETE ---")
 
 class EventScout:
     """
     Scans the source blockchain for relevant events.
     """
 
-    def __init__(self, connector: BlockchainConnector, contract: Contract):
+    def __init__(
+        self,
+        connector: BlockchainConnector,
+        contract: AsyncContract,
+        topic_filter: Optional[Dict[str, List[Any]]] = None,
+        data_filter: Optional[Dict[str, List[Any]]] = None,
+        oracle: Optional[BridgeOracle] = None
+    ):
         """
         Initializes the scout.
 
         Args:
             connector (BlockchainConnector): The connector to the source blockchain.
-            contract (Contract): The Web3.py contract object to monitor.
+            contract (AsyncContract): The Web3.py contract object to monitor.
+            topic_filter (Optional[Dict[str, List[Any]]]): Accepted values per indexed event argument,
+                e.g. {'token': [allowed token addresses]}. The node then only returns matching logs.
+                Only indexed arguments can be filtered this way; in the current ABI these are
+                'token' and 'sender' ('destinationChainId' would have to be indexed by the contract).
+            data_filter (Optional[Dict[str, List[Any]]]): Accepted values per non-indexed, statically sized
+                event argument, e.g. {'destinationChainId': [chain ID]}. The node cannot filter on these,
+                but logs are checked against them on the raw data before being decoded.
+            oracle (Optional[BridgeOracle]): If given, expired oracle prices are refreshed within the
+                batch request of each poll, saving a separate round trip when events are processed.
         """
         self.connector = connector
         self.contract = contract
+        # Resolved once so that each scan only has to fill in the block range.
+        self._event = contract.events.TokensLocked()
+        self._process_log = self._event.process_log
+        self.address = contract.address
+        self.topic0 = self._event.topic
+        self.log_filter: LogsSubscriptionArg = {'address': self.address, 'topics': self._build_topics(topic_filter or {})}
+        # Cheap checks on the raw topics and data words, so that only matching logs are ABI-decoded.
+        self._topic_checks = [
+            (position, frozenset(HexBytes(value) for value in ([values] if isinstance(values, str) else values)))
+            for position, values in enumerate(self.log_filter['topics']) if values is not None
+        ]
+        self._data_checks = self._build_data_checks(data_filter or {})
+        self._batch_failures = 0
+        self.oracle = oracle
+        self._batch_price_reads = oracle is not None
+        self._price_batch_failures = 0
+
+    def _build_topics(self, topic_filter: Dict[str, List[Any]]) -> List[Any]:
+        """
+        Builds the `topics` array for the event: topic0 followed by one slot per indexed argument,
+        holding the ABI-encoded accepted values (OR-ed by the node) or None for "any".
+
+        Args:
+            topic_filter (Dict[str, List[Any]]): Accepted values per indexed event argument.
+
+        Returns:
+            List[Any]: The topics array, without trailing wildcard slots.
+        """
+        indexed_inputs = [item for item in self._event.abi['inputs'] if item['indexed']]
+        unknown = set(topic_filter) - {item['name'] for item in indexed_inputs}
+        if unknown:
+            raise ValueError(f"Cannot filter on non-indexed or unknown event arguments: {sorted(unknown)}")
+
+        codec = self.connector.web3.codec
+        topics: List[Any] = [self.topic0]
+        for item in indexed_inputs:
+            values = topic_filter.get(item['name'])
+            topics.append([Web3.to_hex(codec.encode([item['type']], [value])) for value in values] if values else None)
+        while topics[-1] is None:
+            topics.pop()
+        return topics
+
+    def _build_data_checks(self, data_filter: Dict[str, List[Any]]) -> List[Tuple[int, FrozenSet[bytes]]]:
+        """
+        Locates the 32-byte data words of non-indexed event arguments and ABI-encodes their accepted values.
+
+        Args:
+            data_filter (Dict[str, List[Any]]): Accepted values per non-indexed event argument.
+
+        Returns:
+            List[Tuple[int, FrozenSet[bytes]]]: The byte offset of each filtered argument's word in the
+            log data, with the encoded values accepted there.
+        """
+        data_inputs = [item for item in self._event.abi['inputs'] if not item['indexed']]
+        unknown = set(data_filter) - {item['name'] for item in data_inputs}
+        if unknown:
+            raise ValueError(f"Cannot filter on indexed or unknown event arguments: {sorted(unknown)}")
+
+        codec = self.connector.web3.codec
+        checks = []
+        for position, item in enumerate(data_inputs):
+            if item['type'] in ('string', 'bytes') or item['type'].startswith('tuple') or '[' in item['type']:
+                # Dynamic or multi-word arguments shift the offsets of everything after them.
+                if data_filter.keys() - {previous['name'] for previous in data_inputs[:position]}:
+                    raise ValueError(f"Cannot filter on event arguments after '{item['name']}' ({item['type']}) in the raw data.")
+                break
+            values = data_filter.get(item['name'])
+            if values:
+                checks.append((32 * position, frozenset(codec.encode([item['type']], [value]) for value in values)))
+        return checks
+
+    def _build_filter_params(self, from_block: int, to_block: int) -> FilterParams:
+        """Builds the `eth_getLogs` parameters for 'TokensLocked' events in a block range."""
+        return {**self.log_filter, 'fromBlock': from_block, 'toBlock': to_block}
+
+    @staticmethod
+    def to_columns(events: List[EventData]) -> Dict[str, List[Any]]:
+        """
+        Converts decoded events into a column-oriented batch (one list per field),
+        so that bulk filtering only touches the fields it needs.
+
+        Args:
+            events (List[EventData]): Decoded 'TokensLocked' events.
+
+        Returns:
+            Dict[str, List[Any]]: Parallel lists keyed by 'events', 'amounts' and 'destination_chains',
+            the fields that `TransactionProcessor.process_batch` filters on.
+        """
+        args = [event['args'] for event in events]
+        return {
+            'events': events,
+            'amounts': [a['amount'] for a in args],
+            'destination_chains': [a['destinationChainId'] for a in args]
+        }
 
-    def scan_blocks(self, from_block: int, to_block: int) -> List[Dict[str, Any]]:
+    def decode_logs(self, logs: List[LogReceipt]) -> List[EventData]:
         """
-        Scans a range of blocks for 'TokensLocked' events.
+        Decodes raw logs into 'TokensLocked' events. Logs are first checked against the topic and
+        data filters on their raw bytes, so that only matching logs pay for ABI decoding;
+        any log that does not match the event ABI is skipped.
+
+        Args:
+            logs (List[LogReceipt]): Raw logs as returned by `eth_getLogs`.
+
+        Returns:
+            List[EventData]: The decoded events.
+        """
+        events = []
+        process_log = self._process_log
+        topic_checks = self._topic_checks
+        data_checks = self._data_checks
+        for log in logs:
+            topics = log['topics']
+            if any(position >= len(topics) or topics[position] not in accepted for position, accepted in topic_checks):
+                continue
+            data = log['data']
+            if any(data[offset:offset + 32] not in accepted for offset, accepted in data_checks):
+                continue
+            try:
+                events.append(process_log(log))
+            except MismatchedABI as e:
+                logging.warning(f"Could not decode log {log['logIndex']} of transaction {Web3.to_hex(log['transactionHash'])}: {e}")
+        skipped = len(logs) - len(events)
+        if skipped:
+            logging.info(f"Skipped {skipped} log(s) not matching the event filters before decoding.")
+        return events
+
+    async def poll(self, from_block: int, to_block: int) -> Tuple[Optional[BlockData], Optional[List[EventData]]]:
+        """
+        Fetches the latest block together with the 'TokensLocked' events in a range of blocks.
+        Both are requested in a single batch when the provider supports it, together with the
+        oracle's price feed if its cached price has expired; otherwise they are fetched
+        concurrently as individual requests.
+
+        A failed batch only counts against batching if the same log query then
+        succeeds on its own, so that oversized ranges do not disable batching.
+        Failed batches that carried the price feed read count against that read instead.
+
+        Args:
+            from_block (int): The starting block number.
+            to_block (int): The ending block number.
+
+        Returns:
+            Tuple[Optional[BlockData], Optional[List[EventData]]]: The latest block and the found events,
+            each None if the corresponding request failed.
+        """
+        price_call = self.oracle.price_call() if self._batch_price_reads and self.connector.batching_supported else None
+        result = await self.connector.batch_poll(
+            self._build_filter_params(from_block, to_block),
+            [price_call] if price_call else []
+        )
+        if result is not None:
+            self._batch_failures = 0
+            logging.info(f"Scanned blocks from {from_block} to {to_block} in a batch request.")
+            block, logs, extra_results = result
+            if price_call:
+                self._price_batch_failures = 0
+                self.oracle.update_price(extra_results[0])
+            return block, self.decode_logs(logs)
+
+        block, events = await asyncio.gather(
+            self.connector.get_latest_block(),
+            self.scan_blocks(from_block, to_block)
+        )
+        if not self.connector.batching_supported or events is None:
+            return block, events
+        if price_call:
+            # The price feed call may be what broke the batch.
+            self._price_batch_failures += 1
+            if self._price_batch_failures >= MAX_BATCH_FAILURES:
+                logging.warning("Batch requests with a price feed read keep failing. Reading prices separately.")
+                self._batch_price_reads = False
+        else:
+            self._batch_failures += 1
+            if self._batch_failures >= MAX_BATCH_FAILURES:
+                logging.warning("Provider does not appear to support batch requests. Falling back to individual requests.")
+                self.connector.batching_supported = False
+        return block, events
+
+    async def scan_blocks(self, from_block: int, to_block: int) -> Optional[List[EventData]]:
+        """
+        Scans a range of blocks for 'TokensLocked' events with a single `eth_getLogs` call.
 
         Args:
             from_block (int): The starting block number.
             to_block (int): The ending block number.
 
         Returns:
-            List[Dict[str, Any]]: A list of found event logs.
+            Optional[List[EventData]]: A list of found event logs, or None if the query failed
+            (e.g. the provider rejected the range as too large).
         """
         if from_block > to_block:
             return []
 
         logging.info(f"Scanning blocks from {from_block} to {to_block}...")
         try:
-            event_filter = self.contract.events.TokensLocked.create_filter(
-                fromBlock=from_block,
-                toBlock=to_block
-            )
-            events = event_filter.get_all_entries()
-            return events
+            logs = await self.connector.get_logs(self._build_filter_params(from_block, to_block))
+            return self.decode_logs(logs)
         except BlockNotFound:
             logging.warning(f"Block range not found: {from_block}-{to_block}. The node might not have this history.")
         except Exception as e:
             logging.error(f"An error occurred while scanning blocks: {e}")
-        return []
+        return None
 
 class BridgeOrchestrator:
     """
@@ -309,6 +1103,8 @@ class BridgeOrchestrator:
     def __init__(self, config: Dict[str, Any]):
         """
         Initializes all components of the bridge listener.
+        Components that require network I/O (the connection and the contract)
+        are set up asynchronously at the start of `run()`.
 
         Args:
             config (Dict[str, Any]): A dictionary containing all necessary configuration.
@@ -316,73 +1112,286 @@ class BridgeOrchestrator:
         self.config = config
         self.is_running = False
         self.last_processed_block = None
+        self._max_chunk = config.get('max_chunk_blocks', MAX_CHUNK_BLOCKS)
+        self._chunk = min(INITIAL_CHUNK_BLOCKS, self._max_chunk)
+        self._chunk_ceiling = self._max_chunk # Lowered when the provider rejects a range
+        self._chunk_ceiling_set_at = 0.0
+        self._query_retry_delay = QUERY_RETRY_DELAY
+        self._block_time_ema = config.get('block_time_estimate', BLOCK_TIME_ESTIMATE)
+        self._head: Optional[BlockData] = None
 
         # Initialize components
-        self.connector = BlockchainConnector(config['rpc_url'])
-        self.oracle = BridgeOracle(config['oracle_endpoint'])
-        self.processor = TransactionProcessor(self.oracle)
-        
-        contract = self.connector.get_contract(config['contract_address'], config['contract_abi'])
+        self.connector = BlockchainConnector(config['rpc_urls'])
+        self.ws_connector = WebsocketConnector(config['ws_url']) if config.get('ws_url') else None
+        self._ws_retry_delay = WS_RETRY_DELAY
+        self._ws_retry_at = 0.0
+        self.oracle = BridgeOracle(self.connector, config['price_feed_address'], config.get('oracle_cache_ttl', ORACLE_CACHE_TTL))
+        self.store = StateStore(config['state_db_path']) if config.get('state_db_path') else None
+        self.processor = TransactionProcessor(self.oracle, store=self.store, verbose=config.get('verbose', False))
+        self.scout: Optional[EventScout] = None
+
+    async def _initialize(self) -> None:
+        """Connects to the source chain and sets up the event scout."""
+        await self.connector.connect()
+        contract = await self.connector.get_contract(self.config['contract_address'], self.config['contract_abi'])
         if not contract:
             raise RuntimeError("Failed to initialize bridge contract. Check connection and address.")
-        self.scout = EventScout(self.connector, contract)
+        self.scout = EventScout(
+            self.connector,
+            contract,
+            topic_filter=self._topic_filter(),
+            data_filter=self._data_filter(),
+            oracle=self.oracle
+        )
         
         logging.info("Bridge Orchestrator initialized successfully.")
 
-    def run(self) -> None:
+    def _topic_filter(self) -> Dict[str, List[Any]]:
+        """
+        Builds the node-side event filter from the configuration.
+        If the contract ABI indexes 'destinationChainId', events for other chains are filtered out by the node too.
+        """
+        topic_filter = {}
+        if self.config.get('token_allowlist'):
+            topic_filter['token'] = self.config['token_allowlist']
+        event_abi = next(item for item in self.config['contract_abi'] if item.get('name') == 'TokensLocked')
+        if any(item['name'] == 'destinationChainId' and item['indexed'] for item in event_abi['inputs']):
+            topic_filter['destinationChainId'] = [DESTINATION_CHAIN_ID]
+        return topic_filter
+
+    def _data_filter(self) -> Dict[str, List[Any]]:
+        """
+        Builds the filter checked on raw log data before decoding: if 'destinationChainId' is not
+        indexed, events for other chains are still returned by the node but dropped without being decoded.
+        """
+        event_abi = next(item for item in self.config['contract_abi'] if item.get('name') == 'TokensLocked')
+        if any(item['name'] == 'destinationChainId' and not item['indexed'] for item in event_abi['inputs']):
+            return {'destinationChainId': [DESTINATION_CHAIN_ID]}
+        return {}
+
+    async def _run_subscription(self) -> bool:
+        """
+        Processes 'TokensLocked' events pushed over a WebSocket `eth_subscribe("logs")` subscription.
+        Returns when the subscription cannot be established or ends, so that the caller can fall back to polling.
+
+        Returns:
+            bool: True if the subscription was established, False otherwise.
+        """
+        await self.ws_connector.connect()
+        if not self.ws_connector.web3:
+            logging.warning("WebSocket connection unavailable. Falling back to HTTP polling.")
+            return False
+
+        try:
+            await self.ws_connector.subscribe_logs(self.scout.log_filter)
+        except Exception as e:
+            logging.error(f"Log subscription failed: {e}. Falling back to HTTP polling.")
+            await self.ws_connector.disconnect()
+            return False
+
+        try:
+            # Close the gap between the last processed block and the subscription over HTTP.
+            # Events delivered by both are deduplicated by the processor.
+            head = await self.connector.get_latest_block_number()
+            if head is None:
+                logging.warning("Could not fetch latest block to close the subscription gap. Falling back to HTTP polling.")
+                return True
+            if head > self.last_processed_block:
+                events = await self.scout.scan_blocks(self.last_processed_block + 1, head)
+                if events is None:
+                    logging.warning("Could not scan the subscription gap. Falling back to HTTP polling.")
+                    return True
+                await self.processor.process_batch(EventScout.to_columns(events))
+                self._checkpoint(head)
+
+            async for log in self.ws_connector.stream_logs():
+                if log.get('removed'):
+                    logging.warning(f"Ignoring log removed by a chain reorganization: {Web3.to_hex(log['transactionHash'])}")
+                    continue
+                events = self.scout.decode_logs([log])
+                if events:
+                    await self.processor.process_batch(EventScout.to_columns(events))
+                # Blocks before this log's block have been fully delivered.
+                if log['blockNumber'] - 1 > self.last_processed_block:
+                    self._checkpoint(log['blockNumber'] - 1)
+                if not self.is_running:
+                    break
+            logging.warning("Log subscription ended. Falling back to HTTP polling.")
+        except Exception as e:
+            logging.error(f"Log subscription failed: {e}. Falling back to HTTP polling.")
+        finally:
+            await self.ws_connector.disconnect()
+        return True
+
+    def _checkpoint(self, block_number: int) -> None:
+        """Advances `last_processed_block` and persists it, if a state store is configured."""
+        self.last_processed_block = block_number
+        if self.store:
+            self.store.save_last_block(block_number)
+
+    def _observe_head(self, block: BlockData) -> int:
+        """
+        Records the latest block and folds the interval since the previously seen head
+        into the moving average of the chain's block time.
+
+        Args:
+            block (BlockData): The latest block reported by the node.
+
+        Returns:
+            int: The block's number.
+        """
+        if self._head is not None and block['number'] > self._head['number']:
+            interval = (block['timestamp'] - self._head['timestamp']) / (block['number'] - self._head['number'])
+            self._block_time_ema = (1 - BLOCK_TIME_SMOOTHING) * self._block_time_ema + BLOCK_TIME_SMOOTHING * interval
+        if self._head is None or block['number'] >= self._head['number']:
+            self._head = block
+        return block['number']
+
+    def _next_block_delay(self) -> float:
+        """Returns the seconds until the block after the last observed head is expected."""
+        elapsed = time.time() - self._head['timestamp']
+        # Never longer than one block time (e.g. clock skew), never shorter than the minimum poll interval.
+        return max(MIN_POLL_INTERVAL, min(self._block_time_ema - elapsed, self._block_time_ema))
+
+    def _subscription_due(self) -> bool:
+        """Returns True if a WebSocket URL is configured and the next subscription attempt is due."""
+        return self.ws_connector is not None and time.monotonic() >= self._ws_retry_at
+
+    async def _try_subscription(self) -> None:
+        """
+        Runs the WebSocket subscription until it stops, then schedules the next attempt.
+        The retry delay is reset after a subscription was established and doubles
+        (up to `WS_MAX_RETRY_DELAY`) after every failed attempt.
+        """
+        if await self._run_subscription():
+            self._ws_retry_delay = WS_RETRY_DELAY
+        else:
+            self._ws_retry_delay = min(self._ws_retry_delay * 2, WS_MAX_RETRY_DELAY)
+        self._ws_retry_at = time.monotonic() + self._ws_retry_delay
+        logging.info(f"Polling over HTTP; retrying the WebSocket subscription in {self._ws_retry_delay:.0f}s.")
+
+    async def run(self) -> None:
         """
         Starts the main event loop of the listener.
+
+        Each iteration fetches the latest block number and the logs of the next
+        block range together (see `EventScout.poll`). The range is chosen speculatively (the next
+        chunk of blocks); events beyond the reported head are discarded and
+        picked up again by a later iteration.
+
+        The chunk size adapts to the chain: it doubles after every empty range (up to
+        `max_chunk_blocks`) and halves whenever the log query fails, e.g. because the
+        provider rejected the range as too large. After a failure it does not grow past the
+        halved size for `CHUNK_CEILING_RESET` seconds.
+
+        If a WebSocket URL is configured, events are received through a log subscription
+        whenever the listener is caught up, and polling only bridges the time until a
+        dropped subscription can be re-established.
         """
+        try:
+            await self._initialize()
+            await self._listen()
+        finally:
+            # Also reached when initialization fails, so that the HTTP session and database are released.
+            await self.connector.disconnect()
+            if self.store:
+                self.store.close()
+            logging.info("Bridge listener has stopped.")
+
+    async def _listen(self) -> None:
+        """Determines the starting block and runs the polling loop until the listener is stopped."""
         self.is_running = True
         logging.info("Starting the cross-chain bridge listener...")
 
-        # Determine the starting block
-        # In a real system, this would be loaded from a persistent store (DB, file).
-        latest_block = self.connector.get_latest_block_number()
+        # Determine the starting block: resume from the stored checkpoint if there is one.
+        latest_block = await self.connector.get_latest_block_number()
         if latest_block is None:
             logging.error("Could not fetch latest block. Shutting down.")
             return
-        self.last_processed_block = latest_block - 1 # Start from the block before the current one
+        stored_block = self.store.load_last_block() if self.store else None
+        if stored_block is not None:
+            self.last_processed_block = stored_block
+            logging.info(f"Resuming from stored checkpoint at block {stored_block}.")
+        else:
+            self.last_processed_block = latest_block - 1 # Start from the block before the current one
+        known_head = latest_block
 
         logging.info(f"Starting scan from block: {self.last_processed_block}")
 
         while self.is_running:
             try:
-                current_block = self.connector.get_latest_block_number()
-                if current_block is None:
+                if self.last_processed_block >= known_head and self._subscription_due():
+                    # Caught up: switch to push-based delivery until the subscription drops.
+                    await self._try_subscription()
+                    continue
+
+                from_block = self.last_processed_block + 1
+                scanned = self.last_processed_block < known_head
+                if not scanned:
+                    # Nothing to scan speculatively until a new head is observed.
+                    head = await self.connector.get_latest_block()
+                    events = None
+                else:
+                    # Process in chunks to avoid overwhelming the RPC node.
+                    assumed_to_block = self.last_processed_block + self._chunk
+                    head, events = await self.scout.poll(from_block, assumed_to_block)
+
+                if head is None:
                     logging.warning("Failed to get current block, will retry...")
-                    time.sleep(10)
+                    await asyncio.sleep(10)
                     continue
+                current_block = known_head = self._observe_head(head)
 
                 if self.last_processed_block >= current_block:
                     # We are caught up, wait for the next block
-                    logging.info(f"Caught up to block {current_block}. Waiting for next block...")
-                    time.sleep(15) # Wait time depends on the chain's block time
+                    if self._subscription_due():
+                        continue
+                    # Wake up just after the next block is expected, based on the observed block time.
+                    delay = self._next_block_delay()
+                    logging.info(f"Caught up to block {current_block}. Waiting {delay:.1f}s for the next block...")
+                    await asyncio.sleep(delay)
                     continue
+                if not scanned:
+                    # A new head was observed; scan up to it on the next iteration.
+                    continue
+                if events is None:
+                    if self._chunk > MIN_CHUNK_BLOCKS:
+                        # Retry the same range with a smaller chunk, and do not grow back into the rejected size.
+                        self._chunk = max(self._chunk // 2, MIN_CHUNK_BLOCKS)
+                        self._chunk_ceiling = min(self._chunk_ceiling, self._chunk)
+                        self._chunk_ceiling_set_at = time.monotonic()
+                        logging.warning(f"Log query failed, reducing block range to {self._chunk} blocks.")
+                    else:
+                        # Shrinking no longer helps (outage, rate limit, ...); back off before retrying.
+                        logging.warning(f"Log query failed, retrying in {self._query_retry_delay:.0f}s...")
+                        await asyncio.sleep(self._query_retry_delay)
+                        self._query_retry_delay = min(self._query_retry_delay * 2, MAX_QUERY_RETRY_DELAY)
+                    continue
+                self._query_retry_delay = QUERY_RETRY_DELAY
 
-                # Define the range of blocks to scan in this iteration.
-                # Process in chunks to avoid overwhelming the RPC node.
-                to_block = min(self.last_processed_block + 100, current_block)
-
-                events = self.scout.scan_blocks(self.last_processed_block + 1, to_block)
+                # Define the range of blocks covered by this iteration.
+                to_block = min(assumed_to_block, current_block)
+                events = [event for event in events if event['blockNumber'] <= to_block]
+                if self._chunk_ceiling < self._max_chunk and time.monotonic() - self._chunk_ceiling_set_at > CHUNK_CEILING_RESET:
+                    # The rejection may have been transient (or the provider's limit raised); probe larger ranges again.
+                    self._chunk_ceiling = self._max_chunk
+                if not events and to_block == assumed_to_block and self._chunk < self._chunk_ceiling:
+                    # Only grow after scanning a full range, not while idling at the head.
+                    self._chunk = min(self._chunk * 2, self._chunk_ceiling)
                 if events:
-                    logging.info(f"Found {len(events)} new 'TokensLocked' event(s) between blocks {self.last_processed_block + 1} and {to_block}.")
-                    for event in events:
-                        self.processor.process_lock_event(event)
+                    logging.info(f"Found {len(events)} new 'TokensLocked' event(s) between blocks {from_block} and {to_block}.")
+                    await self.processor.process_batch(EventScout.to_columns(events))
                 
-                # Update the last processed block
-                # IMPORTANT: This must be done atomically in a real system.
-                self.last_processed_block = to_block
+                # Update the last processed block only after all of its events were handled.
+                self._checkpoint(to_block)
 
-            except KeyboardInterrupt:
-                logging.info("Keyboard interrupt received. Shutting down...")
+            except asyncio.CancelledError:
+                logging.info("Shutdown requested. Stopping the listener...")
                 self.is_running = False
             except Exception as e:
                 logging.critical(f"An unhandled exception occurred in the main loop: {e}", exc_info=True)
                 # In a real system, implement a backoff strategy before restarting.
-                time.sleep(30)
-
-        logging.info("Bridge listener has stopped.")
+                await asyncio.sleep(30)
 
 
 if __name__ == "__main__":
@@ -390,26 +1399,29 @@ if __name__ == "__main__":
     # It sets up the configuration and starts the orchestrator.
     
     # Configuration check
-    if not SOURCE_CHAIN_RPC_URL or not BRIDGE_CONTRACT_ADDRESS:
+    if not SOURCE_CHAIN_RPC_URLS or not BRIDGE_CONTRACT_ADDRESS:
         raise ValueError("Configuration error: Please set SOURCE_CHAIN_RPC_URL and BRIDGE_CONTRACT_ADDRESS in your .env file.")
 
     app_config = {
-        'rpc_url': SOURCE_CHAIN_RPC_URL,
+        'rpc_urls': SOURCE_CHAIN_RPC_URLS,
+        'ws_url': SOURCE_CHAIN_WS_URL,
         'contract_address': BRIDGE_CONTRACT_ADDRESS,
         'contract_abi': BRIDGE_CONTRACT_ABI,
-        'oracle_endpoint': ORACLE_API_ENDPOINT
+        'price_feed_address': CHAINLINK_ETH_USD_FEED,
+        'oracle_cache_ttl': ORACLE_CACHE_TTL,
+        'max_chunk_blocks': MAX_CHUNK_BLOCKS,
+        'block_time_estimate': BLOCK_TIME_ESTIMATE,
+        'state_db_path': STATE_DB_PATH,
+        'token_allowlist': TOKEN_ALLOWLIST,
+        'verbose': VERBOSE_EVENT_LOGS
     }
 
     try:
         orchestrator = BridgeOrchestrator(app_config)
-        orchestrator.run()
+        asyncio.run(orchestrator.run())
+    except KeyboardInterrupt:
+        logging.info("Keyboard interrupt received. Shutting down...")
     except RuntimeError as e:
         logging.critical(f"Failed to start the orchestrator: {e}")
     except Exception as e:
         logging.critical(f"A fatal error occurred during initialization: {e}", exc_info=True)
-
-
-
-
-
-